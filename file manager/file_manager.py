@@ -1,8 +1,89 @@
 import os
+import locale
 import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
 import platform
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+PLATFORM_SYSTEM = platform.system()
+DIR_CACHE_SIZE = 64
+INSERT_BATCH_SIZE = 200
+# A first lstat slower than this means a network or otherwise slow filesystem
+SLOW_STAT_SECONDS = 0.002
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    FIND_EX_INFO_BASIC = 1
+    FIND_EX_SEARCH_NAME_MATCH = 0
+    FIND_FIRST_EX_LARGE_FETCH = 2
+    FILE_ATTRIBUTE_DIRECTORY = 0x10
+    FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+    IO_REPARSE_TAG_SYMLINK = 0xA000000C
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _FindFirstFileExW = _kernel32.FindFirstFileExW
+    _FindFirstFileExW.restype = wintypes.HANDLE
+    _FindFirstFileExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                                  ctypes.c_int, wintypes.LPVOID, wintypes.DWORD]
+    _FindNextFileW = _kernel32.FindNextFileW
+    _FindNextFileW.restype = wintypes.BOOL
+    _FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _FindClose = _kernel32.FindClose
+    _FindClose.restype = wintypes.BOOL
+    _FindClose.argtypes = [wintypes.HANDLE]
+
+
+def _win_scandir(path):
+    # FindExInfoBasic skips the 8.3 short name and LARGE_FETCH returns many entries per kernel call.
+    # Returns (name, is_dir, is_symlink, inode) like list_directory's scandir branch; no inode here
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = _FindFirstFileExW(os.path.join(path, "*"), FIND_EX_INFO_BASIC, ctypes.byref(data),
+                               FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH)
+    if handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    entries = []
+    try:
+        while True:
+            name = data.cFileName
+            if name not in (".", ".."):
+                attrs = data.dwFileAttributes
+                is_symlink = bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT
+                                  and data.dwReserved0 == IO_REPARSE_TAG_SYMLINK)
+                is_dir = bool(attrs & FILE_ATTRIBUTE_DIRECTORY) and not is_symlink
+                entries.append((name, is_dir, is_symlink, 0))
+            if not _FindNextFileW(handle, ctypes.byref(data)):
+                break
+    finally:
+        _FindClose(handle)
+    return entries
+
+
+# Pick the "open with default app" handler once at import.
+# Popen returns immediately, the window doesn't wait for the viewer to exit
+if PLATFORM_SYSTEM == 'Windows':
+    _open_path = os.startfile
+elif PLATFORM_SYSTEM == 'Darwin':  # macOS
+    def _open_path(path):
+        subprocess.Popen(['open', path], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+else:  # linux variants
+    def _open_path(path):
+        subprocess.Popen(['xdg-open', path], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def format_path_size(path):
+    try:
+        return f"{os.lstat(path).st_size / 1024:.1f} KB"
+    except OSError:
+        return "N/A"
 
 
 class FileManager:
@@ -21,79 +102,19 @@ class FileManager:
 
         self.current_path = os.getcwd()
 
+        # Row ids in display order, and file rows whose size has not been loaded yet
+        self._row_ids = []
+        self._pending_sizes = {}
+        # path -> (mtime_ns, sorted listing without sizes), least recently used first
+        self._dir_cache = OrderedDict()
+        # Pending after() id while a listing is still being inserted in batches
+        self._insert_job = None
+        # Created on first use by stat_pool()
+        self._stat_pool = None
+
         self.create_widgets()
         self.refresh_file_list()
 
-    def create_widgets(self):
-        # Top bar
-        top_frame = tk.Frame(self.root, bg=self.bg_color)
-        top_frame.pack(fill=tk.X, padx=10, pady=10)
-
-        self.up_button = tk.Button(top_frame, text="⬆ Up", command=self.go_up,
-                                   bg=self.select_bg, fg=self.fg_color, relief=tk.FLAT)
-        self.up_button.pack(side=tk.LEFT, padx=(0, 10))
-
-        self.path_label = tk.Label(top_frame, text=self.current_path,
-                                   bg=self.bg_color, fg=self.fg_color, font=("Arial", 10))
-        self.path_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        # File list
-        list_frame = tk.Frame(self.root, bg=self.list_bg)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-
-        self.tree = ttk.Treeview(list_frame, columns=("Size", "Type"), show="headings")
-        self.tree.heading("Size", text="Size")
-        self.tree.heading("Type", text="Type")
-
-        # Style for Treeview
-        style = ttk.Style()
-        style.theme_use("clam")
-        style.configure("Treeview", background=self.list_bg,
-                        foreground=self.fg_color, fieldbackground=self.list_bg, borderwidth=0)
-        style.map("Treeview", background=[('selected', self.select_bg)])
-
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-
-        self.tree.bind("<Double-1>", self.on_double_click)
-
-    def refresh_file_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        self.path_label.config(text=self.current_path)
-
-        try:
-            items = os.listdir(self.current_path)
-            items.sort(key=lambda x: os.path.isdir(os.path.join(self.current_path, x)), reverse=True)
-
-            for item in items:
-                full_path = os.path.join(self.current_path, item)
-                is_dir = os.path.isdir(full_path)
-
-                size = ""
-                if not is_dir:
-                    try:
-                        size = f"{os.path.getsize(full_path) / 1024:.1f} KB"
-                    except OSError:
-                        size = "N/A"
-
-                item_type = "Folder" if is_dir else "File"
-
-                # Insert with text as the filename (first column usually, but we use headings)
-                # Treeview default column '#0' is hidden with show="headings" if we don't want it,
-                # but here we want the name. Let's adjust columns.
-                # Actually, let's use #0 for name.
-
-                self.tree.insert("", tk.END, text=item, values=(size, item_type))
-
-        except PermissionError:
-            messagebox.showerror("Error", "Permission Denied")
-
-    # Fix Treeview columns to show Name
     def create_widgets(self):
         # Top bar
         top_frame = tk.Frame(self.root, bg=self.bg_color)
@@ -130,40 +151,136 @@ class FileManager:
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Every view change (scroll, resize) goes through here so sizes can be loaded lazily
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
 
         self.tree.bind("<Double-1>", self.on_double_click)
 
     def refresh_file_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Drop any batches still queued for the previous directory
+        if self._insert_job is not None:
+            self.tree.after_cancel(self._insert_job)
+            self._insert_job = None
+
+        # One Tcl call for the whole clear instead of one per row
+        self.tree.delete(*self.tree.get_children())
 
         self.path_label.config(text=self.current_path)
+        self._row_ids = []
+        self._pending_sizes = {}
 
         try:
-            items = os.listdir(self.current_path)
-            # Sort: Directories first, then files
-            items.sort(key=lambda x: (not os.path.isdir(os.path.join(self.current_path, x)), x.lower()))
-
-            for item in items:
-                full_path = os.path.join(self.current_path, item)
-                is_dir = os.path.isdir(full_path)
-
-                size = ""
-                if not is_dir:
-                    try:
-                        size = f"{os.path.getsize(full_path) / 1024:.1f} KB"
-                    except OSError:
-                        size = "N/A"
-
-                item_type = "Folder" if is_dir else "File"
-
-                self.tree.insert("", tk.END, values=(item, size, item_type))
-
+            rows = self.list_directory(self.current_path)
         except PermissionError:
             messagebox.showerror("Error", "Permission Denied")
+            return
+
+        self.insert_batch(rows, 0)
+        self.tree.after_idle(lambda: self.load_visible_sizes(*self.tree.yview()))
+
+    def insert_batch(self, rows, start):
+        # Insert INSERT_BATCH_SIZE rows per event-loop tick so large folders don't freeze the window
+        stop = start + INSERT_BATCH_SIZE
+
+        # Hide the columns while populating so Tk skips column layout per insert
+        self.tree.configure(displaycolumns=())
+        # Call the Tcl insert command directly, skipping ttk's per-call option formatting
+        tcl_call, tree_w = self.tree.tk.call, self.tree._w
+        for not_dir, _sort_key, name, is_symlink, inode in rows[start:stop]:
+            # Sizes are filled in by load_visible_sizes once the row is scrolled into view.
+            # Symlinks are shown as links and only resolved when opened
+            if not not_dir:
+                item_type = "Folder"
+            elif is_symlink:
+                item_type = "Link"
+            else:
+                item_type = "File"
+            item_id = tcl_call(tree_w, "insert", "", "end", "-values", (name, "", item_type))
+            self._row_ids.append(item_id)
+            if not_dir:
+                self._pending_sizes[item_id] = (inode, os.path.join(self.current_path, name))
+        self.tree.configure(displaycolumns="#all")
+
+        if stop < len(rows):
+            self._insert_job = self.tree.after(1, self.insert_batch, rows, stop)
+        else:
+            self._insert_job = None
+
+    def list_directory(self, path):
+        # Reuse the last listing while the directory's mtime is unchanged. Only names and
+        # types are cached: a file's size can change without touching the directory's mtime
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            self._dir_cache.move_to_end(path)
+            return cached[1]
+
+        entries = None
+        if os.name == "nt":
+            try:
+                entries = _win_scandir(path)
+            except OSError:
+                pass
+        if entries is None:
+            # One scandir pass; DirEntry knows the type and inode from readdir, so no stat per
+            # entry (on Windows inode() would stat, so it is skipped there)
+            with os.scandir(path) as it:
+                entries = [(e.name, e.is_dir(follow_symlinks=False), e.is_symlink(),
+                            e.inode() if os.name != "nt" else 0) for e in it]
+
+        # Sort: Directories first, then files, in locale order. Keys are computed once per
+        # entry (strxfrm of the casefolded name); the raw name breaks ties
+        decorated = [(not is_dir, locale.strxfrm(name.casefold()), name, is_symlink, inode)
+                     for name, is_dir, is_symlink, inode in entries]
+        decorated.sort()
+
+        self._dir_cache[path] = (mtime, decorated)
+        self._dir_cache.move_to_end(path)
+        while len(self._dir_cache) > DIR_CACHE_SIZE:
+            self._dir_cache.popitem(last=False)
+        return decorated
+
+    def on_tree_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.load_visible_sizes(first, last)
+
+    def load_visible_sizes(self, first, last):
+        if not self._pending_sizes:
+            return
+
+        count = len(self._row_ids)
+        start = int(float(first) * count)
+        stop = min(count, int(float(last) * count) + 1)
+
+        visible = [(item_id, self._pending_sizes.pop(item_id))
+                   for item_id in self._row_ids[start:stop] if item_id in self._pending_sizes]
+
+        # Stat in inode order so the inode table is read sequentially (inodes are 0 on Windows).
+        # Sizes always come from a fresh lstat, never from the cached listing
+        visible.sort(key=lambda row: row[1][0])
+        paths = [full_path for _item_id, (_inode, full_path) in visible]
+
+        if not paths:
+            return
+
+        # Time the first lstat: on a warm local disk the rest are cheaper serially than through
+        # a pool. stat() releases the GIL, so slow (network) filesystems serve the rest concurrently
+        started = time.perf_counter()
+        sizes = [format_path_size(paths[0])]
+        if time.perf_counter() - started > SLOW_STAT_SECONDS:
+            sizes.extend(self.stat_pool().map(format_path_size, paths[1:]))
+        else:
+            sizes.extend(map(format_path_size, paths[1:]))
+
+        for (item_id, _row), size in zip(visible, sizes):
+            self.tree.set(item_id, "Size", size)
+
+    def stat_pool(self):
+        if self._stat_pool is None:
+            self._stat_pool = ThreadPoolExecutor(max_workers=16)
+        return self._stat_pool
 
     def go_up(self):
         parent_path = os.path.dirname(self.current_path)
@@ -173,12 +290,13 @@ class FileManager:
 
     def on_double_click(self, event):
         item_id = self.tree.selection()[0]
-        item_values = self.tree.item(item_id, "values")
-        item_name = item_values[0]
+        # The Type column already says whether this is a folder, no need to stat it again
+        item_name, _size, item_type = self.tree.item(item_id, "values")
 
         full_path = os.path.join(self.current_path, item_name)
 
-        if os.path.isdir(full_path):
+        # Links are resolved here, on open, rather than while listing
+        if item_type == "Folder" or (item_type == "Link" and os.path.isdir(full_path)):
             self.current_path = full_path
             self.refresh_file_list()
         else:
@@ -186,17 +304,14 @@ class FileManager:
 
     def open_file(self, filepath):
         try:
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.call(('open', filepath))
-            elif platform.system() == 'Windows':  # Windows
-                os.startfile(filepath)
-            else:  # linux variants
-                subprocess.call(('xdg-open', filepath))
+            _open_path(filepath)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}")
 
 
 if __name__ == "__main__":
+    # Use the user's collation rules for sorting file names
+    locale.setlocale(locale.LC_COLLATE, "")
     root = tk.Tk()
     app = FileManager(root)
     root.mainloop()
@@ -1,15 +1,181 @@
 import sys
 import os
 import shutil
+import subprocess
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTreeView, QVBoxLayout,
                              QHBoxLayout, QWidget, QPushButton, QLineEdit,
                              QSplitter, QListView, QLabel,
-                             QToolBar, QMenu, QMessageBox, QInputDialog, QFileDialog)
-from PyQt6.QtCore import Qt, QDir, QFileInfo, QSize, QFileSystemModel
+                             QToolBar, QMenu, QMessageBox, QInputDialog, QFileDialog,
+                             QFileIconProvider)
+from PyQt6.QtCore import (Qt, QDir, QEvent, QSize, QFileSystemModel, QTimer,
+                          QObject, QRunnable, QThreadPool, QSortFilterProxyModel,
+                          QModelIndex, QPersistentModelIndex, pyqtSignal)
 from PyQt6.QtGui import QAction
 
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
+
+_HOME_PATH = str(Path.home())
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Platform-specific "open with default application", chosen once at import.
+# No shell is involved, so quotes or $ in file names are passed through untouched
+if sys.platform == 'win32':
+    _open_path = os.startfile
+elif sys.platform == 'darwin':
+    def _open_path(path):
+        subprocess.Popen(['open', path], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+else:
+    def _open_path(path):
+        subprocess.Popen(['xdg-open', path], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+# Modern dark theme, applied by ModernFileExplorer.apply_theme
+_STYLESHEET = """
+QMainWindow {
+    background-color: #1e1e2e;
+}
+QTreeView, QListView {
+    background-color: #282838;
+    color: #e0e0e0;
+    border: none;
+    font-size: 13px;
+    outline: none;
+}
+QTreeView::item:hover, QListView::item:hover {
+    background-color: #3e3e4e;
+}
+QTreeView::item:selected, QListView::item:selected {
+    background-color: #5e5ece;
+}
+QHeaderView::section {
+    background-color: #1e1e2e;
+    color: #e0e0e0;
+    padding: 8px;
+    border: none;
+    font-weight: bold;
+}
+QLineEdit {
+    background-color: #282838;
+    color: #e0e0e0;
+    border: 2px solid #3e3e4e;
+    border-radius: 5px;
+    padding: 8px;
+    font-size: 13px;
+}
+QLineEdit:focus {
+    border: 2px solid #5e5ece;
+}
+QPushButton {
+    background-color: #5e5ece;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-size: 12px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #7e7eee;
+}
+QPushButton:pressed {
+    background-color: #4e4ebe;
+}
+QToolBar {
+    background-color: #1e1e2e;
+    border: none;
+    padding: 5px;
+    spacing: 5px;
+}
+QLabel {
+    color: #e0e0e0;
+    font-size: 12px;
+}
+QMenu {
+    background-color: #282838;
+    color: #e0e0e0;
+    border: 1px solid #3e3e4e;
+}
+QMenu::item:selected {
+    background-color: #5e5ece;
+}
+"""
+
+
+class _StatusSignals(QObject):
+    """Carries status scan results back to the GUI thread"""
+    done = pyqtSignal(int, int, int, str)
+
+
+class _StatusScan(QRunnable):
+    """Count folders and files of a directory on a worker thread"""
+
+    def __init__(self, generation, path, signals):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        # scandir's DirEntry knows the type from readdir, so no stat per entry
+        dirs = files = 0
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs += 1
+                        else:
+                            files += 1
+                    except OSError:
+                        files += 1
+        except OSError:
+            dirs = files = -1
+        self.signals.done.emit(self.generation, dirs, files, self.path)
+
+
+class _DeleteSignals(QObject):
+    """Carries the outcome of a background delete back to the GUI thread"""
+    # path, whether it went to the trash, and the exception or None
+    finished = pyqtSignal(str, bool, object)
+
+
+class _DeleteJob(QRunnable):
+    """Move a file or a whole directory tree to the trash, or delete it, on a worker thread"""
+
+    def __init__(self, path, signals, use_trash):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+        self.use_trash = use_trash
+
+    def run(self):
+        error = None
+        try:
+            if self.use_trash:
+                # One OS-level move to the trash instead of unlinking every child from Python
+                send2trash(self.path)
+            elif os.path.isdir(self.path):
+                shutil.rmtree(self.path)
+            else:
+                os.remove(self.path)
+        except Exception as e:
+            error = e
+        self.signals.finished.emit(self.path, self.use_trash, error)
+
+
+class _NameOnlyProxyModel(QSortFilterProxyModel):
+    """Expose only the name column of a QFileSystemModel"""
+
+    def filterAcceptsColumn(self, source_column, source_parent):
+        return source_column == 0
+
 
 class ModernFileExplorer(QMainWindow):
     def __init__(self):
@@ -22,86 +188,67 @@ class ModernFileExplorer(QMainWindow):
 
         # Initialize file system model
         self.model = QFileSystemModel()
-        self.model.setRootPath(QDir.rootPath())
+        # Skip per-directory custom icon lookups (desktop.ini / shell icons), use generic folder icons
+        self._icon_provider = QFileIconProvider()
+        self._icon_provider.setOptions(QFileIconProvider.Option.DontUseCustomDirectoryIcons)
+        self.model.setIconProvider(self._icon_provider)
+        self.model.setOption(QFileSystemModel.Option.DontUseCustomDirectoryIcons, True)
+        # No file system watcher: a folder already loaded keeps its contents until it is
+        # refreshed (Refresh, new folder, delete), see _schedule_refresh
+        self.model.setOption(QFileSystemModel.Option.DontWatchForChanges, True)
         self.model.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot | QDir.AllDirs)
+        # List entries as they are, without resolving symlink targets
+        self.model.setResolveSymlinks(False)
+
+        # The list view only needs names; hide the size/type/date columns from it.
+        # No sorting or row filtering happens here, so don't re-filter on every model change
+        self._list_proxy = _NameOnlyProxyModel(self)
+        self._list_proxy.setDynamicSortFilter(False)
+        self._list_proxy.setSourceModel(self.model)
 
         # Store current path
-        self.current_path = str(Path.home())
+        self.current_path = _HOME_PATH
+
+        # Root the model at the start folder instead of the filesystem root, so Qt doesn't
+        # load and watch "/" up front; the tree root only moves up when navigating outside it.
+        # model.rootPath() is kept equal to _tree_root, see _sync_tree_root and _apply_refresh
+        self._tree_root = self.current_path
+        self.model.setRootPath(self._tree_root)
+
+        # path -> QPersistentModelIndex, oldest first, see _index
+        self._idx_cache = OrderedDict()
+
+        # Visited folders for Back/Forward
+        self._history = deque(maxlen=128)
+        self._future = deque(maxlen=128)
+
+        # Coalesce bursts of refresh requests into a single model update
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._apply_refresh)
+        # Folders to re-list on the next refresh, see _schedule_refresh
+        self._refresh_paths = set()
+
+        # Work skipped while the window was hidden or minimized, see _resume_pending_updates
+        self._refresh_pending = False
+        self._status_pending = False
+
+        # Folder/file counts are computed off the GUI thread, see update_status
+        self._status_generation = 0
+        self._status_signals = _StatusSignals(self)
+        self._status_signals.done.connect(self._on_status_scanned)
+
+        # Deletes also run on the thread pool, see delete_item
+        self._delete_signals = _DeleteSignals(self)
+        self._delete_signals.finished.connect(self._on_delete_finished)
 
         # Setup UI
         self.setup_ui()
 
     def apply_theme(self):
         """Apply modern dark theme to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e2e;
-            }
-            QTreeView, QListView {
-                background-color: #282838;
-                color: #e0e0e0;
-                border: none;
-                font-size: 13px;
-                outline: none;
-            }
-            QTreeView::item:hover, QListView::item:hover {
-                background-color: #3e3e4e;
-            }
-            QTreeView::item:selected, QListView::item:selected {
-                background-color: #5e5ece;
-            }
-            QHeaderView::section {
-                background-color: #1e1e2e;
-                color: #e0e0e0;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-            QLineEdit {
-                background-color: #282838;
-                color: #e0e0e0;
-                border: 2px solid #3e3e4e;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5e5ece;
-            }
-            QPushButton {
-                background-color: #5e5ece;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7e7eee;
-            }
-            QPushButton:pressed {
-                background-color: #4e4ebe;
-            }
-            QToolBar {
-                background-color: #1e1e2e;
-                border: none;
-                padding: 5px;
-                spacing: 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-            QMenu {
-                background-color: #282838;
-                color: #e0e0e0;
-                border: 1px solid #3e3e4e;
-            }
-            QMenu::item:selected {
-                background-color: #5e5ece;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
     def setup_ui(self):
         """Setup the main user interface"""
@@ -114,6 +261,7 @@ class ModernFileExplorer(QMainWindow):
 
         # Create toolbar
         self.create_toolbar()
+        self.create_context_menu()
 
         # Address bar
         address_layout = QHBoxLayout()
@@ -135,7 +283,7 @@ class ModernFileExplorer(QMainWindow):
         # Tree view (folder structure)
         self.tree_view = QTreeView()
         self.tree_view.setModel(self.model)
-        self.tree_view.setRootIndex(self.model.index(QDir.rootPath()))
+        self.tree_view.setRootIndex(self._index(self._tree_root))
         self.tree_view.setAnimated(True)
         self.tree_view.setIndentation(20)
         self.tree_view.setSortingEnabled(True)
@@ -146,8 +294,8 @@ class ModernFileExplorer(QMainWindow):
 
         # List view (file details)
         self.list_view = QListView()
-        self.list_view.setModel(self.model)
-        self.list_view.setRootIndex(self.model.index(self.current_path))
+        self.list_view.setModel(self._list_proxy)
+        self._set_list_root(self._index(self.current_path))
         self.list_view.setViewMode(QListView.ViewMode.IconMode)
         self.list_view.setIconSize(QSize(64, 64))
         self.list_view.setGridSize(QSize(100, 100))
@@ -177,23 +325,21 @@ class ModernFileExplorer(QMainWindow):
         # Back button
         back_action = QAction("⬅️ Back", self)
         back_action.triggered.connect(self.go_back)
-        toolbar.addAction(back_action)
 
         # Forward button
         forward_action = QAction("➡️ Forward", self)
         forward_action.triggered.connect(self.go_forward)
-        toolbar.addAction(forward_action)
 
         # Up button
         up_action = QAction("⬆️ Up", self)
         up_action.triggered.connect(self.go_up)
-        toolbar.addAction(up_action)
 
         # Home button
         home_action = QAction("🏠 Home", self)
         home_action.triggered.connect(self.go_home)
-        toolbar.addAction(home_action)
 
+        # Add each group in one call so the toolbar lays out once per group
+        toolbar.addActions([back_action, forward_action, up_action, home_action])
         toolbar.addSeparator()
 
         # Refresh button
@@ -206,51 +352,63 @@ class ModernFileExplorer(QMainWindow):
         # New folder button
         new_folder_action = QAction("📁 New Folder", self)
         new_folder_action.triggered.connect(self.create_new_folder)
-        toolbar.addAction(new_folder_action)
 
         # Delete button
         delete_action = QAction("🗑️ Delete", self)
         delete_action.triggered.connect(self.delete_item)
-        toolbar.addAction(delete_action)
+        toolbar.addActions([new_folder_action, delete_action])
 
         toolbar.addSeparator()
 
         # View mode toggle
         icon_view_action = QAction("🖼️ Icons", self)
         icon_view_action.triggered.connect(lambda: self.set_view_mode(QListView.ViewMode.IconMode))
-        toolbar.addAction(icon_view_action)
 
         list_view_action = QAction("📄 List", self)
         list_view_action.triggered.connect(lambda: self.set_view_mode(QListView.ViewMode.ListMode))
-        toolbar.addAction(list_view_action)
+        toolbar.addActions([icon_view_action, list_view_action])
+
+    def create_context_menu(self):
+        """Build the file context menu once; show_context_menu reuses it"""
+        self._ctx_menu = QMenu(self)
+
+        self._ctx_open_action = QAction("📂 Open", self)
+        self._ctx_copy_action = QAction("📋 Copy", self)
+        self._ctx_cut_action = QAction("✂️ Cut", self)
+        self._ctx_paste_action = QAction("📄 Paste", self)
+        self._ctx_rename_action = QAction("✏️ Rename", self)
+        self._ctx_delete_action = QAction("🗑️ Delete", self)
+        self._ctx_properties_action = QAction("ℹ️ Properties", self)
+
+        self._ctx_menu.addAction(self._ctx_open_action)
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addActions([self._ctx_copy_action, self._ctx_cut_action, self._ctx_paste_action])
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addActions([self._ctx_rename_action, self._ctx_delete_action])
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction(self._ctx_properties_action)
+
+        self._ctx_delete_action.triggered.connect(self.delete_item)
+        self._ctx_properties_action.triggered.connect(self.show_properties)
 
     def on_tree_clicked(self, index):
         """Handle tree view item click"""
         path = self.model.filePath(index)
         if os.path.isdir(path):
-            self.current_path = path
-            self.address_bar.setText(path)
-            self.list_view.setRootIndex(index)
-            self.update_status()
+            self._push_history(path)
+            self._show_folder(path, index)
 
     def on_item_double_clicked(self, index):
         """Handle double click on items"""
+        index = self._list_proxy.mapToSource(index)
         path = self.model.filePath(index)
         if os.path.isdir(path):
-            self.current_path = path
-            self.address_bar.setText(path)
-            self.list_view.setRootIndex(index)
-            self.tree_view.setCurrentIndex(index)
-            self.update_status()
+            self._push_history(path)
+            self._show_folder(path, index)
         else:
             # Open file with default application
             try:
-                if sys.platform == 'win32':
-                    os.startfile(path)
-                elif sys.platform == 'darwin':
-                    os.system(f'open "{path}"')
-                else:
-                    os.system(f'xdg-open "{path}"')
+                _open_path(path)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
 
@@ -258,49 +416,153 @@ class ModernFileExplorer(QMainWindow):
         """Navigate to path entered in address bar"""
         path = self.address_bar.text()
         if os.path.exists(path) and os.path.isdir(path):
-            self.current_path = path
-            index = self.model.index(path)
-            self.list_view.setRootIndex(index)
-            self.tree_view.setCurrentIndex(index)
-            self.update_status()
+            self._push_history(path)
+            self._show_folder(path)
         else:
             QMessageBox.warning(self, "Invalid Path", "The specified path does not exist or is not a directory.")
             self.address_bar.setText(self.current_path)
 
+    def _set_list_root(self, index):
+        """Show the folder at a source-model index in the list view"""
+        # The proxy only keeps column 0; tree clicks on the Size/Type/Date cells use other columns
+        self.list_view.setRootIndex(self._list_proxy.mapFromSource(index.siblingAtColumn(0)))
+
+    def _current_list_index(self):
+        """Source-model index of the list view's current item"""
+        return self._list_proxy.mapToSource(self.list_view.currentIndex())
+
+    def _index(self, path):
+        """Model index for path, cached so revisited folders skip the model's path walk"""
+        cached = self._idx_cache.get(path)
+        if cached is None or not cached.isValid():
+            cached = QPersistentModelIndex(self.model.index(path))
+            self._idx_cache[path] = cached
+            if len(self._idx_cache) > 1024:
+                self._idx_cache.popitem(last=False)
+        return QModelIndex(cached)
+
+    def _sync_tree_root(self, path):
+        """Move the tree root up to cover path when navigating outside the current tree"""
+        root = os.path.normcase(os.path.normpath(self._tree_root))
+        target = os.path.normcase(os.path.normpath(path))
+        if target == root or target.startswith(os.path.join(root, "")):
+            return
+        # Re-root at the common ancestor so the folders already in the tree stay visible.
+        # abspath resolves ".." the same way the check above does
+        path = os.path.abspath(path)
+        try:
+            new_root = os.path.commonpath([os.path.abspath(self._tree_root), path])
+        except ValueError:
+            # Different drives on Windows
+            new_root = path
+        self._tree_root = new_root
+        self.model.setRootPath(new_root)
+        self.tree_view.setRootIndex(self._index(new_root))
+
+    def _show_folder(self, path, index=None):
+        """Show a folder in the address bar, list view and tree view"""
+        self.current_path = path
+        self.address_bar.setText(path)
+        self._sync_tree_root(path)
+        if index is None:
+            index = self._index(path)
+        self._set_list_root(index)
+        self.tree_view.setCurrentIndex(index)
+        self.update_status()
+
+    def _push_history(self, path):
+        """Remember the current folder before moving to path"""
+        if path != self.current_path:
+            self._history.append(self.current_path)
+            self._future.clear()
+
+    @staticmethod
+    def _pop_existing(stack):
+        """Pop folders off a history stack until one still exists, or return None"""
+        while stack:
+            path = stack.pop()
+            if os.path.isdir(path):
+                return path
+        return None
+
     def go_back(self):
-        """Navigate back (placeholder for history implementation)"""
-        self.update_status("Back navigation - implement history for full functionality")
+        """Navigate back to the previously visited folder"""
+        path = self._pop_existing(self._history)
+        if path is None:
+            self.update_status("No previous folder")
+            return
+        self._future.append(self.current_path)
+        self._show_folder(path)
 
     def go_forward(self):
-        """Navigate forward (placeholder for history implementation)"""
-        self.update_status("Forward navigation - implement history for full functionality")
+        """Navigate forward again after going back"""
+        path = self._pop_existing(self._future)
+        if path is None:
+            self.update_status("No next folder")
+            return
+        self._history.append(self.current_path)
+        self._show_folder(path)
 
     def go_up(self):
         """Navigate to parent directory"""
-        parent = str(Path(self.current_path).parent)
+        # normpath drops a trailing separator typed into the address bar
+        parent = os.path.dirname(os.path.normpath(self.current_path)) or self.current_path
         if parent != self.current_path:
-            self.current_path = parent
-            self.address_bar.setText(parent)
-            index = self.model.index(parent)
-            self.list_view.setRootIndex(index)
-            self.tree_view.setCurrentIndex(index)
-            self.update_status()
+            self._push_history(parent)
+            self._show_folder(parent)
 
     def go_home(self):
         """Navigate to home directory"""
-        self.current_path = str(Path.home())
-        self.address_bar.setText(self.current_path)
-        index = self.model.index(self.current_path)
-        self.list_view.setRootIndex(index)
-        self.tree_view.setCurrentIndex(index)
-        self.update_status()
+        self._push_history(_HOME_PATH)
+        self._show_folder(_HOME_PATH)
+
+    def _is_hidden(self):
+        """True while the window is hidden or minimized"""
+        return not self.isVisible() or self.isMinimized()
+
+    def _resume_pending_updates(self):
+        """Run the refresh/status work that was skipped while hidden"""
+        if self._refresh_pending:
+            self._schedule_refresh()
+        if self._status_pending:
+            self.update_status()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_pending_updates()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._resume_pending_updates()
 
     def refresh_view(self):
         """Refresh the current view"""
-        self.model.setRootPath("")
-        self.model.setRootPath(QDir.rootPath())
+        self._schedule_refresh()
         self.update_status("View refreshed")
 
+    def _schedule_refresh(self, path=None):
+        """Request a refresh of path (default: the current folder); requests within 100ms are merged into one"""
+        self._refresh_paths.add(path or self.current_path)
+        self._refresh_timer.start()
+
+    def _apply_refresh(self):
+        """Re-read only the requested directories instead of the whole root tree"""
+        if self._is_hidden():
+            # Don't touch the filesystem while hidden; showEvent/changeEvent pick this up
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        paths, self._refresh_paths = self._refresh_paths, set()
+        # Moving the root away marks the old root's children stale, so setting it
+        # back makes the model list the directory again
+        for path in paths:
+            self.model.setRootPath(path)
+            self.model.setRootPath("")
+            self.model.setRootPath(path)
+        # Leave the model rooted where the tree view is
+        self.model.setRootPath(self._tree_root)
+
     def create_new_folder(self):
         """Create a new folder in current directory"""
         folder_name, ok = QInputDialog.getText(self, "New Folder", "Enter folder name:")
@@ -308,14 +570,14 @@ class ModernFileExplorer(QMainWindow):
             new_path = os.path.join(self.current_path, folder_name)
             try:
                 os.makedirs(new_path, exist_ok=True)
-                self.refresh_view()
+                self._schedule_refresh()
                 self.update_status(f"Created folder: {folder_name}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not create folder: {str(e)}")
 
     def delete_item(self):
         """Delete selected item"""
-        index = self.list_view.currentIndex()
+        index = self._current_list_index()
         if not index.isValid():
             QMessageBox.warning(self, "No Selection", "Please select an item to delete.")
             return
@@ -323,20 +585,44 @@ class ModernFileExplorer(QMainWindow):
         path = self.model.filePath(index)
         file_name = os.path.basename(path)
 
-        reply = QMessageBox.question(self, "Confirm Delete",
-                                     f"Are you sure you want to delete '{file_name}'?",
+        use_trash = send2trash is not None
+        if use_trash:
+            question = f"Move '{file_name}' to Trash?"
+        else:
+            question = f"Are you sure you want to delete '{file_name}'?"
+        reply = QMessageBox.question(self, "Confirm Delete", question,
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
-                self.refresh_view()
-                self.update_status(f"Deleted: {file_name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete item: {str(e)}")
+            self._start_delete(path, use_trash)
+
+    def _start_delete(self, path, use_trash):
+        """Delete on a worker thread so large trees don't freeze the window"""
+        QThreadPool.globalInstance().start(_DeleteJob(path, self._delete_signals, use_trash))
+        action = "Moving to Trash" if use_trash else "Deleting"
+        self.update_status(f"{action}: {os.path.basename(path)}")
+
+    def _on_delete_finished(self, path, trashed, error):
+        """Report a finished background delete and refresh the view"""
+        file_name = os.path.basename(path)
+        if error is not None and trashed:
+            # e.g. no usable trash folder on this filesystem; offer a permanent delete instead
+            reply = QMessageBox.question(self, "Confirm Delete",
+                                         f"Could not move '{file_name}' to Trash: {str(error)}\n\n"
+                                         "Delete it permanently?",
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            if reply == QMessageBox.StandardButton.Yes:
+                self._start_delete(path, False)
+            else:
+                self.update_status(f"Not deleted: {file_name}")
+            return
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Could not delete item: {str(error)}")
+            return
+        self._idx_cache.pop(path, None)
+        # Refresh the folder the item was in; the user may have moved on while it was deleting
+        self._schedule_refresh(os.path.dirname(path))
+        self.update_status(f"{'Moved to Trash' if trashed else 'Deleted'}: {file_name}")
 
     def set_view_mode(self, mode):
         """Set the view mode for list view"""
@@ -350,34 +636,17 @@ class ModernFileExplorer(QMainWindow):
 
     def show_context_menu(self, position):
         """Show context menu for file operations"""
-        menu = QMenu()
-
-        open_action = menu.addAction("📂 Open")
-        menu.addSeparator()
-        copy_action = menu.addAction("📋 Copy")
-        cut_action = menu.addAction("✂️ Cut")
-        paste_action = menu.addAction("📄 Paste")
-        menu.addSeparator()
-        rename_action = menu.addAction("✏️ Rename")
-        delete_action = menu.addAction("🗑️ Delete")
-        menu.addSeparator()
-        properties_action = menu.addAction("ℹ️ Properties")
-
-        action = menu.exec(self.list_view.mapToGlobal(position))
-
-        if action == delete_action:
-            self.delete_item()
-        elif action == properties_action:
-            self.show_properties()
+        # Actions are connected to their handlers in create_context_menu
+        self._ctx_menu.exec(self.list_view.mapToGlobal(position))
 
     def show_properties(self):
         """Show properties of selected item"""
-        index = self.list_view.currentIndex()
+        index = self._current_list_index()
         if not index.isValid():
             return
 
-        path = self.model.filePath(index)
-        file_info = QFileInfo(path)
+        # The model already holds the file's info, no need to stat it again
+        file_info = self.model.fileInfo(index)
 
         info_text = f"""
         Name: {file_info.fileName()}
@@ -391,24 +660,35 @@ class ModernFileExplorer(QMainWindow):
 
     def format_size(self, size):
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        if size < 1:
+            return f"{size:.2f} B"
+        # Every 10 bits is one 1024 step, so the unit comes straight from the bit length
+        idx = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
     def update_status(self, message=None):
         """Update status bar"""
+        # Any newer update makes scans that are still running stale
+        self._status_generation += 1
         if message:
             self.status_label.setText(message)
+        elif self._is_hidden():
+            # Nobody can see the counts; scan once the window is back
+            self._status_pending = True
         else:
-            try:
-                items = os.listdir(self.current_path)
-                dirs = sum(1 for item in items if os.path.isdir(os.path.join(self.current_path, item)))
-                files = len(items) - dirs
-                self.status_label.setText(f"📁 {dirs} folders | 📄 {files} files | Current: {self.current_path}")
-            except:
-                self.status_label.setText(f"Current: {self.current_path}")
+            # Count entries on a worker thread so navigation never waits on the filesystem
+            self._status_pending = False
+            scan = _StatusScan(self._status_generation, self.current_path, self._status_signals)
+            QThreadPool.globalInstance().start(scan)
+
+    def _on_status_scanned(self, generation, dirs, files, path):
+        """Show the counts from the latest status scan"""
+        if generation != self._status_generation:
+            return
+        if dirs < 0:
+            self.status_label.setText(f"Current: {path}")
+        else:
+            self.status_label.setText(f"📁 {dirs} folders | 📄 {files} files | Current: {path}")
 
 
 def main():